@@ -8,11 +8,12 @@ from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Literal, NamedTuple, final, overload
 
+from vsexprtools import norm_expr
 from vstools import (
     MISSING, ColorRange, ColorRangeT, Colorspace, ConstantFormatVideoNode, CustomIndexError, CustomRuntimeError,
-    CustomStrEnum, CustomValueError, FieldBased, FuncExceptT, FunctionUtil, KwargsT, Matrix, MatrixT, MissingT, PlanesT,
-    Self, SingleOrArr, check_variable, core, depth, get_video_format, get_y, is_gpu_available, join, normalize_seq, vs,
-    vs_object, UnsupportedFieldBasedError
+    CustomStrEnum, CustomValueError, FieldBased, FuncExceptT, FunctionUtil, KwargsNotNone, KwargsT, Matrix,
+    MatrixT, MissingT, PlanesT, Self, SingleOrArr, check_variable, core, depth, get_video_format, get_y,
+    is_gpu_available, join, normalize_seq, vs, vs_object, UnsupportedFieldBasedError
 )
 
 from .types import _Plugin_bm3dcpu_Core_Bound, _Plugin_bm3dcuda_Core_Bound, _Plugin_bm3dcuda_rtc_Core_Bound
@@ -28,6 +29,37 @@ __all__ = [
 ]
 
 
+# Luma coefficients (Kr, Kb) of the matrices the OPP conversion can be fused with
+_MATRIX_COEFFICIENTS = {
+    1: (0.2126, 0.0722),  # BT709
+    4: (0.3, 0.11),  # FCC
+    5: (0.299, 0.114),  # BT470BG
+    6: (0.299, 0.114),  # SMPTE170M
+    7: (0.212, 0.087),  # SMPTE240M
+    9: (0.2627, 0.0593),  # BT2020NCL
+}
+
+# Same coefficients as bm3d.RGB2OPP/OPP2RGB
+_RGB_TO_OPP = ((1 / 3, 1 / 3, 1 / 3), (1 / 2, 0.0, -1 / 2), (1 / 4, -1 / 2, 1 / 4))
+_OPP_TO_RGB = ((1.0, 1.0, 2 / 3), (1.0, 0.0, -4 / 3), (1.0, -1.0, 2 / 3))
+
+
+def _matmul(a: tuple[tuple[float, ...], ...], b: tuple[tuple[float, ...], ...]) -> tuple[tuple[float, ...], ...]:
+    return tuple(tuple(sum(a[i][k] * b[k][j] for k in range(3)) for j in range(3)) for i in range(3))
+
+
+def _apply_matrix(clip: vs.VideoNode, coefs: tuple[tuple[float, ...], ...]) -> vs.VideoNode:
+    # Every plane of the output is a weighted sum of all the input planes.
+    # Rotating the planes of the other two inputs makes all of them available to a single Expr.
+    rotated = [clip.std.ShufflePlanes([i % 3, (i + 1) % 3, (i + 2) % 3], vs.YUV) for i in (1, 2)]
+
+    return norm_expr(
+        [clip, *rotated], tuple(
+            f'x {coefs[p][p]} * y {coefs[p][(p + 1) % 3]} * + z {coefs[p][(p + 2) % 3]} * +' for p in range(3)
+        )
+    )
+
+
 @dataclass
 class BM3DColorspaceConfig:
     csp: Colorspace
@@ -39,30 +71,60 @@ class BM3DColorspaceConfig:
 
     @overload
     def check_clip(
-        self, clip: vs.VideoNode, matrix: MatrixT | None, range_in: ColorRangeT | None, func: FuncExceptT
+        self, clip: vs.VideoNode, matrix: MatrixT | None, range_in: ColorRangeT | None, func: FuncExceptT,
+        frame: vs.VideoFrame | None = None
     ) -> ConstantFormatVideoNode:
         ...
 
     @overload
     def check_clip(
-        self, clip: None, matrix: MatrixT | None, range_in: ColorRangeT | None, func: FuncExceptT
+        self, clip: None, matrix: MatrixT | None, range_in: ColorRangeT | None, func: FuncExceptT,
+        frame: vs.VideoFrame | None = None
     ) -> None:
         ...
 
     def check_clip(
-        self, clip: vs.VideoNode | None, matrix: MatrixT | None, range_in: ColorRangeT | None, func: FuncExceptT
+        self, clip: vs.VideoNode | None, matrix: MatrixT | None, range_in: ColorRangeT | None, func: FuncExceptT,
+        frame: vs.VideoFrame | None = None
     ) -> ConstantFormatVideoNode | None:
+        """
+        Make sure the clip has the props needed for the colorspace conversion.
+
+        :param frame:   First frame of the clip, used to read props.
+                        If not specified and any prop is missing from the arguments,
+                        the frame will be requested only once.
+        """
+
         if clip is None:
             return None
 
         fmt = get_video_format(clip)
+        is_base = clip is self.clip
+
+        needs_range = range_in is None and (fmt.sample_type != vs.FLOAT or fmt.bits_per_sample != 32)
+        needs_matrix = matrix is None and fmt.color_family == vs.YUV and (self.csp.is_rgb or self.csp.is_opp)
+
+        if frame is None and (needs_range or needs_matrix):
+            with clip.get_frame(0) as f:
+                return self.check_clip(clip, matrix, range_in, func, f)
 
         if fmt.sample_type != vs.FLOAT or fmt.bits_per_sample != 32:
-            clip = ColorRange.ensure_presence(clip, range_in or ColorRange.from_video(clip), func)
+            if range_in is None:
+                assert frame
+                range_in = ColorRange.from_video(frame, func=func)
+
+            clip = ColorRange.ensure_presence(clip, range_in, func)
 
         if fmt.color_family == vs.YUV and (self.csp.is_rgb or self.csp.is_opp):
+            if matrix is None:
+                assert frame
+                matrix = Matrix.from_video(frame, True, func)
+
             clip = Matrix.ensure_presence(clip, matrix, func)
 
+            if self.matrix is None and is_base:
+                self.matrix = Matrix.from_param(matrix)
+
         assert check_variable(clip, func)
 
         return clip
@@ -84,14 +146,56 @@ class BM3DColorspaceConfig:
 
         assert check_variable(clip, self.prepare_clip)
 
+        if clip.format.color_family is vs.YUV and (opp_matrix := self.opp_matrices):
+            yuv444 = clip.format.replace(sample_type=vs.FLOAT, bits_per_sample=32, subsampling_w=0, subsampling_h=0)
+
+            return _apply_matrix(clip.resize.Bicubic(format=yuv444.id), opp_matrix[0])
+
         return self.csp.from_clip(clip, self.fp32, self.prepare_clip)
 
+    @property
+    def opp_matrices(self) -> tuple[tuple[tuple[float, ...], ...], tuple[tuple[float, ...], ...]] | None:
+        """
+        YUV -> OPP and OPP -> YUV conversion matrices,
+        if the conversion can be done with a single Expr instead of going through RGB.
+        """
+
+        if (
+            self.csp is not Colorspace.OPP_BM3D or not self.fp32 or self.matrix is None
+            or (coefs := _MATRIX_COEFFICIENTS.get(self.matrix.value)) is None
+        ):
+            return None
+
+        kr, kb = coefs
+        kg = 1 - kr - kb
+
+        yuv_to_rgb = (
+            (1.0, 0.0, 2 - 2 * kr),
+            (1.0, -2 * kb * (1 - kb) / kg, -2 * kr * (1 - kr) / kg),
+            (1.0, 2 - 2 * kb, 0.0)
+        )
+        rgb_to_yuv = (
+            (kr, kg, kb),
+            (-kr / (2 - 2 * kb), -kg / (2 - 2 * kb), 1 / 2),
+            (1 / 2, -kg / (2 - 2 * kr), -kb / (2 - 2 * kr))
+        )
+
+        return _matmul(_RGB_TO_OPP, yuv_to_rgb), _matmul(rgb_to_yuv, _OPP_TO_RGB)
+
     def post_processing(self, clip: vs.VideoNode) -> vs.VideoNode:
         assert clip.format
 
         if self.clip.format.color_family is vs.YUV:
             if clip.format.color_family is vs.GRAY:
-                clip = join(depth(clip, self.clip), self.clip)
+                # Only the luma went through bm3d, the chroma planes are taken as-is from the source
+                return self.clip if self.chroma_only else join(depth(clip, self.clip), self.clip)
+
+            if opp_matrix := self.opp_matrices:
+                clip = _apply_matrix(clip, opp_matrix[1])
+
+                # YUV444PS sources are already in the right format, no need for a copy through resize
+                if clip.format.id != self.clip.format.id:
+                    clip = clip.resize.Bicubic(format=self.clip.format.id)
             else:
                 clip = self.csp.to_yuv(clip, self.fp32, self.post_processing, self.clip, matrix=self.matrix)
         elif self.clip.format.color_family is vs.RGB:
@@ -103,6 +207,10 @@ class BM3DColorspaceConfig:
         return depth(clip, self.clip)
 
 
+# Parameters accepted by the BM3D function of each plugin, by namespace
+_cuda_signature_keys = dict[str, set[str]]()
+
+
 class ProfileBase:
     @dataclass
     class Config:
@@ -168,38 +276,7 @@ class ProfileBase:
             elif self.profile is Profile.VERY_NOISY:
                 raise CustomValueError('Profile "VERY_NOISY" is not supported!', reason='BM3DCuda')
             else:
-                if aggregate:
-                    if basic:
-                        PROFILES = {
-                            Profile.FAST: KwargsT(block_step=8, bm_range=7, ps_num=2, ps_range=4),
-                            Profile.LOW_COMPLEXITY: KwargsT(block_step=6, bm_range=9, ps_num=2, ps_range=4),
-                            Profile.NORMAL: KwargsT(block_step=4, bm_range=12, ps_num=2, ps_range=5),
-                            Profile.HIGH: KwargsT(block_step=3, bm_range=16, ps_num=2, ps_range=7),
-                        }
-                    else:
-                        PROFILES = {
-                            Profile.FAST: KwargsT(block_step=7, bm_range=7, ps_num=2, ps_range=5),
-                            Profile.LOW_COMPLEXITY: KwargsT(block_step=5, bm_range=9, ps_num=2, ps_range=5),
-                            Profile.NORMAL: KwargsT(block_step=3, bm_range=12, ps_num=2, ps_range=6),
-                            Profile.HIGH: KwargsT(block_step=2, bm_range=16, ps_num=2, ps_range=8),
-                        }
-                else:
-                    if basic:
-                        PROFILES = {
-                            Profile.FAST: KwargsT(block_step=8, bm_range=9),
-                            Profile.LOW_COMPLEXITY: KwargsT(block_step=6, bm_range=9),
-                            Profile.NORMAL: KwargsT(block_step=4, bm_range=16),
-                            Profile.HIGH: KwargsT(block_step=3, bm_range=16),
-                        }
-                    else:
-                        PROFILES = {
-                            Profile.FAST: KwargsT(block_step=7, bm_range=9),
-                            Profile.LOW_COMPLEXITY: KwargsT(block_step=5, bm_range=9),
-                            Profile.NORMAL: KwargsT(block_step=3, bm_range=16),
-                            Profile.HIGH: KwargsT(block_step=2, bm_range=16),
-                        }
-
-                values = PROFILES[self.profile]  # type: ignore[assignment]
+                values = KwargsT(_CUDA_PROFILES[aggregate, basic][self.profile])
 
             values |= kwargs | self.overrides
 
@@ -212,8 +289,9 @@ class ProfileBase:
                 values |= args
 
             if cuda:
-                func = cuda.BM3Dv2 if hasattr(cuda, 'BM3Dv2') else cuda.BM3D
-                cuda_keys = set[str](func.__signature__.parameters.keys())
+                if (cuda_keys := _cuda_signature_keys.get(cuda.namespace)) is None:
+                    func = cuda.BM3Dv2 if hasattr(cuda, 'BM3Dv2') else cuda.BM3D
+                    cuda_keys = _cuda_signature_keys[cuda.namespace] = set(func.__signature__.parameters.keys())
 
                 values = {
                     key: value for key, value in values.items()
@@ -251,12 +329,19 @@ class Profile(ProfileBase, CustomStrEnum):
 
     def __call__(
         self,
-        block_step: int | None = None, bm_range: int | None = None,
+        block_step: int | tuple[int, int] | None = None, bm_range: int | None = None,
         block_size: int | None = None, group_size: int | None = None,
         bm_step: int | None = None, th_mse: float | None = None, hard_thr: float | None = None,
         ps_num: int | None = None, ps_range: int | None = None, ps_step: int | None = None,
         basic_kwargs: KwargsT | None = None, final_kwargs: KwargsT | None = None, **kwargs: Any
     ) -> Profile.Config:
+        # A (basic, final) tuple lets the final estimate use a finer step than the basic one
+        if isinstance(block_step, tuple):
+            block_step_basic, block_step_final = block_step
+            block_step = None
+        else:
+            block_step_basic = block_step_final = None
+
         return ProfileBase.Config(
             self, kwargs, basic_kwargs or {}, final_kwargs or {},
             {
@@ -266,16 +351,47 @@ class Profile(ProfileBase, CustomStrEnum):
                 ).items() if value is not None
             },
             {
-                key: value for key, value in KwargsT(hard_thr=hard_thr).items() if value is not None
+                key: value for key, value in KwargsT(
+                    block_step=block_step_basic, hard_thr=hard_thr
+                ).items() if value is not None
             },
             {
                 key: value for key, value in KwargsT(
-                    ps_num=ps_num, ps_range=ps_range, ps_step=ps_step
+                    block_step=block_step_final, ps_num=ps_num, ps_range=ps_range, ps_step=ps_step
                 ).items() if value is not None
             }
         )
 
 
+# Defaults of the cuda implementations for each profile, by (aggregate, basic) call
+_CUDA_PROFILES = {
+    (True, True): {
+        Profile.FAST: KwargsT(block_step=8, bm_range=7, ps_num=2, ps_range=4),
+        Profile.LOW_COMPLEXITY: KwargsT(block_step=6, bm_range=9, ps_num=2, ps_range=4),
+        Profile.NORMAL: KwargsT(block_step=4, bm_range=12, ps_num=2, ps_range=5),
+        Profile.HIGH: KwargsT(block_step=3, bm_range=16, ps_num=2, ps_range=7),
+    },
+    (True, False): {
+        Profile.FAST: KwargsT(block_step=7, bm_range=7, ps_num=2, ps_range=5),
+        Profile.LOW_COMPLEXITY: KwargsT(block_step=5, bm_range=9, ps_num=2, ps_range=5),
+        Profile.NORMAL: KwargsT(block_step=3, bm_range=12, ps_num=2, ps_range=6),
+        Profile.HIGH: KwargsT(block_step=2, bm_range=16, ps_num=2, ps_range=8),
+    },
+    (False, True): {
+        Profile.FAST: KwargsT(block_step=8, bm_range=9),
+        Profile.LOW_COMPLEXITY: KwargsT(block_step=6, bm_range=9),
+        Profile.NORMAL: KwargsT(block_step=4, bm_range=16),
+        Profile.HIGH: KwargsT(block_step=3, bm_range=16),
+    },
+    (False, False): {
+        Profile.FAST: KwargsT(block_step=7, bm_range=9),
+        Profile.LOW_COMPLEXITY: KwargsT(block_step=5, bm_range=9),
+        Profile.NORMAL: KwargsT(block_step=3, bm_range=16),
+        Profile.HIGH: KwargsT(block_step=2, bm_range=16),
+    },
+}
+
+
 class AbstractBM3D(vs_object):
     """Abstract BM3D-based denoiser interface."""
 
@@ -334,9 +450,21 @@ class AbstractBM3D(vs_object):
                                 See :py:attr:`vstools.enums.ColorRange` for more info.
                                 If not specified, gets the color from the "_ColorRange" prop of the clip.
                                 This check is not performed if the input clip is float.
+        :param colorspace:      Colorspace the clip gets converted to before denoising.
+                                If not specified, OPP is used, unless only the luma is processed.
+        :param fp32:            Whether to process in 32 bit float or in 16 bit integer.
+                                Using 16 bit halves the memory traffic, but only :py:class:`BM3DMawen`
+                                supports it, the BM3DCuda implementations only accept float input.
+                                As VFinal needs the ref in the same format as the clip,
+                                basic and final estimates always run at the same precision.
+                                Default: True.
+        :param radius:          Alias of ``tr``, only used if ``tr`` is not specified.
         """
         assert check_variable(clip, self.__class__)
 
+        if tr is None and radius is not MISSING:
+            tr = radius
+
         self.sigma = self._Sigma(*normalize_seq(sigma, 3))
         self.tr = self._TemporalRadius(*normalize_seq(tr or 0, 2))
 
@@ -354,12 +482,14 @@ class AbstractBM3D(vs_object):
 
         matrix = Matrix.from_param(matrix)
 
-        if (fb := FieldBased.from_video(clip, False, self.__class__)).is_inter:
-            raise UnsupportedFieldBasedError('Interlaced input is not supported!', self.__class__, fb)
-
         self.cspconfig = BM3DColorspaceConfig(colorspace, clip, matrix, self.sigma.y == 0, fp32)
 
-        self.cspconfig.clip = self.cspconfig.check_clip(clip, matrix, range_in, self.__class__)
+        # Request the first frame only once for the field order, range and matrix props
+        with clip.get_frame(0) as frame:
+            if (fb := FieldBased.from_video(frame, False, self.__class__)).is_inter:
+                raise UnsupportedFieldBasedError('Interlaced input is not supported!', self.__class__, fb)
+
+            self.cspconfig.clip = self.cspconfig.check_clip(clip, matrix, range_in, self.__class__, frame)
 
         self.profile = profile if isinstance(profile, ProfileBase.Config) else profile()
         self.ref = self.cspconfig.check_clip(ref, matrix, range_in, self.__class__)
@@ -373,6 +503,11 @@ class AbstractBM3D(vs_object):
 
         self.__post_init__()
 
+    def _basic_kwargs(self) -> KwargsT | None:
+        """Resolve the kwargs passed to the bm3d call for the :py:attr:`basic` clip, if known."""
+
+        return None
+
     @abstractmethod
     def basic(self, clip: vs.VideoNode, opp: bool = False) -> vs.VideoNode:
         """
@@ -407,6 +542,10 @@ class AbstractBM3D(vs_object):
 
         sigma = func.norm_seq(sigma)
 
+        # Nothing to denoise, skip building the whole colorspace conversion and bm3d graph
+        if not any(sigma):
+            return clip
+
         ref = get_y(ref) if func.luma_only and ref else ref
 
         bm3d = cls(func.work_clip, sigma, tr, profile, ref, refine, matrix, range_in, colorspace, fp32, **kwargs)
@@ -425,9 +564,26 @@ class AbstractBM3D(vs_object):
 
         self._pre_clip = self.cspconfig.prepare_clip(self.cspconfig.clip)
         self._pre_ref = self.cspconfig.prepare_clip(self.ref)
+        self._pre_basic: tuple[KwargsT, vs.VideoNode] | None = None
+
+    def _get_basic_ref(self, clip: vs.VideoNode) -> vs.VideoNode:
+        # The basic estimate of the source clip is shared by every final call
+        # so VapourSynth doesn't end up with duplicate nodes doing the same work.
+        # It's keyed on the resolved kwargs, as profile and basic_args can be changed after init.
+        if clip is not self._pre_clip:
+            return self.basic(clip, True)
+
+        # Implementations that can't tell their basic kwargs don't get the shared estimate
+        if (kwargs := self._basic_kwargs()) is None:
+            return self.basic(clip, True)
+
+        if self._pre_basic is None or self._pre_basic[0] != kwargs:
+            self._pre_basic = (kwargs, self.basic(clip, True))
+
+        return self._pre_basic[1]
 
     def __vs_del__(self, core_id: int) -> None:
-        del self.cspconfig, self.ref
+        del self.cspconfig, self.ref, self._pre_basic
 
         self.basic_args.clear()
         self.final_args.clear()
@@ -452,17 +608,23 @@ class BM3DMawen(AbstractBM3D):
 
         self._pre_pre = self.cspconfig.prepare_clip(self.pre)
 
+    def _basic_kwargs(self) -> KwargsT:
+        kwargs = KwargsT(ref=self.pre, sigma=self.sigma, matrix=100, args=self.basic_args)
+
+        if self.tr.basic:
+            return self.profile.as_dict(**kwargs, radius=self.tr.basic)  # type: ignore
+
+        return self.profile.as_dict(**kwargs)  # type: ignore
+
     def basic(self, clip: vs.VideoNode | None = None, opp: bool = False) -> vs.VideoNode:
         clip = self.cspconfig.get_clip(self.cspconfig.clip, self._pre_clip, clip)
 
-        kwargs = KwargsT(ref=self.pre, sigma=self.sigma, matrix=100, args=self.basic_args)
-
         if self.tr.basic:
-            clip = clip.bm3d.VBasic(**self.profile.as_dict(**kwargs, radius=self.tr.basic))  # type: ignore
+            clip = clip.bm3d.VBasic(**self._basic_kwargs())
 
             clip = clip.bm3d.VAggregate(self.tr.basic, self.cspconfig.fp32)
         else:
-            clip = clip.bm3d.Basic(**self.profile.as_dict(**kwargs))  # type: ignore
+            clip = clip.bm3d.Basic(**self._basic_kwargs())
 
         return clip if opp else self.cspconfig.post_processing(clip)
 
@@ -474,16 +636,21 @@ class BM3DMawen(AbstractBM3D):
         if self.ref and self._pre_ref:
             ref = self.cspconfig.get_clip(self.ref, self._pre_ref, ref)
         else:
-            ref = self.basic(clip, True)
+            ref = self._get_basic_ref(clip)
 
         kwargs = KwargsT(ref=ref, sigma=self.sigma, matrix=100, args=self.final_args)
 
+        if self.tr.final:
+            kwargs = self.profile.as_dict(**kwargs, radius=self.tr.final)  # type: ignore
+        else:
+            kwargs = self.profile.as_dict(**kwargs)  # type: ignore
+
         for _ in range(refine or self.refine):
             if self.tr.final:
-                clip = clip.bm3d.VFinal(**self.profile.as_dict(**kwargs, radius=self.tr.final))  # type: ignore
+                clip = clip.bm3d.VFinal(**kwargs)
                 clip = clip.bm3d.VAggregate(self.tr.final, self.cspconfig.fp32)
             else:
-                clip = clip.bm3d.Final(**self.profile.as_dict(**kwargs))  # type: ignore
+                clip = clip.bm3d.Final(**kwargs)
 
         return self.cspconfig.post_processing(clip)
 
@@ -502,12 +669,42 @@ class AbstractBM3DCuda(AbstractBM3D, metaclass=AbstractBM3DCudaMeta):
 
     plugin: _Plugin_bm3dcuda_Core_Bound | _Plugin_bm3dcuda_rtc_Core_Bound | _Plugin_bm3dcpu_Core_Bound
 
+    fast: bool | None
+    """Whether to use multi-threaded copies between CPU and GPU. None uses the plugin default."""
+
+    device_id: int | None
+    """GPU the filter runs on. None uses the plugin default."""
+
+    def __init__(
+        self, clip: vs.VideoNode, sigma: SingleOrArr[float] = 0.5, tr: SingleOrArr[int] | None = None,
+        profile: Profile | Profile.Config = Profile.FAST, ref: vs.VideoNode | None = None, refine: int = 1,
+        matrix: MatrixT | None = None, range_in: ColorRangeT | None = None,
+        colorspace: Colorspace | None = None, fp32: bool = True, *, radius: SingleOrArr[int] | MissingT = MISSING,
+        fast: bool | None = None, device_id: int | None = None
+    ) -> None:
+        """
+        :param fast:        Multi-threaded copy between CPU and GPU at the expense of 4x memory consumption.
+                            Ignored by :py:class:`BM3DCPU`.
+                            If not specified, the plugin default is used, which is enabled.
+        :param device_id:   Index of the GPU to run on. Ignored by :py:class:`BM3DCPU`.
+                            If not specified, the plugin default is used, which is the first device.
+        """
+
+        self.fast = fast
+        self.device_id = device_id
+
+        super().__init__(clip, sigma, tr, profile, ref, refine, matrix, range_in, colorspace, fp32, radius=radius)
+
+    def _basic_kwargs(self) -> KwargsT:
+        return self.profile.as_dict(
+            self.plugin, True, False, self.basic_args, sigma=self.sigma, radius=self.tr.basic,
+            **KwargsNotNone(fast=self.fast, device_id=self.device_id)
+        )
+
     def basic(self, clip: vs.VideoNode | None = None, opp: bool = False) -> vs.VideoNode:
         clip = self.cspconfig.get_clip(self.cspconfig.clip, self._pre_clip, clip)
 
-        kwargs = self.profile.as_dict(
-            self.plugin, True, False, self.basic_args, sigma=self.sigma, radius=self.tr.basic
-        )
+        kwargs = self._basic_kwargs()
 
         if hasattr(self.plugin, 'BM3Dv2'):
             clip = self.plugin.BM3Dv2(clip, **kwargs)
@@ -527,10 +724,11 @@ class AbstractBM3DCuda(AbstractBM3D, metaclass=AbstractBM3DCudaMeta):
         if self.ref and self._pre_ref:
             ref = self.cspconfig.get_clip(self.ref, self._pre_ref, ref)
         else:
-            ref = self.basic(clip, True)
+            ref = self._get_basic_ref(clip)
 
         kwargs = self.profile.as_dict(
-            self.plugin, False, True, self.final_args, sigma=self.sigma, radius=self.tr.final
+            self.plugin, False, True, self.final_args, sigma=self.sigma, radius=self.tr.final,
+            **KwargsNotNone(fast=self.fast, device_id=self.device_id)
         )
 
         if hasattr(self.plugin, 'BM3Dv2'):
@@ -559,10 +757,18 @@ class BM3DCPU(AbstractBM3DCuda, plugin=core.lazy.bm3dcpu):
 
 
 class BM3D(AbstractBM3D):
+    gpu_min_area: int = 512 * 512
+    """Clips with fewer pixels than this are processed on CPU, if available, as uploading to GPU would cost more."""
+
     def __new__(cls, *args: Any, **kwargs: Any) -> AbstractBM3D:  # type: ignore
         new_cls: type[AbstractBM3D] | None = None
         gpu_available = is_gpu_available()
 
+        clip: vs.VideoNode = args[0] if args else kwargs['clip']
+
+        if gpu_available and clip.width * clip.height < cls.gpu_min_area and hasattr(core, 'bm3dcpu'):
+            gpu_available = False
+
         if gpu_available and hasattr(core, 'bm3dcuda_rtc'):
             new_cls = BM3DCudaRTC
         elif gpu_available and hasattr(core, 'bm3dcuda'):
@@ -395,8 +395,7 @@ def deblock_qed(
                 .dctf.DCTFilter([1, 1, 0, 0, 0, 0, 0, 0], planes)
             )
 
-        strongD4 = norm_expr([strongD2, normalD2], 'y neutral = x y ?', planes)
-        deblocked = clip.std.MakeDiff(strongD4, planes)
+        deblocked = norm_expr([clip, strongD2, normalD2], 'x z neutral = y z ? - neutral +', planes)
 
         if func.chroma and chroma_mode:
             deblocked = join([deblocked, strong if chroma_mode == 2 else normal])
@@ -182,6 +182,8 @@ class MVTools:
         self.mask_args = fallback(mask_args, KwargsT())
         self.sc_detection_args = fallback(sc_detection_args, KwargsT())
 
+        self._super_clips = list[tuple[vs.VideoNode, vs.VideoNode]]()
+
     def super(
         self, clip: vs.VideoNode | None = None, vectors: MotionVectors | MVTools | None = None, 
         levels: int | None = None, sharp: SharpMode | None = None,
@@ -239,6 +241,8 @@ class MVTools:
 
         super_clip = clip.std.ClipToProp(super_clip, prop='MSuper')
 
+        self._super_clips = [(inc, outc) for inc, outc in self._super_clips if inc != clip]
+
         if clip is self.clip:
             self.clip = super_clip
         if clip is self.search_clip:
@@ -1083,6 +1087,7 @@ class MVTools:
 
             self.clip = self.clip.std.RemoveFrameProps('MSuper')
             self.search_clip = self.search_clip.std.RemoveFrameProps('MSuper')
+            self._super_clips.clear()
 
             vectors.analysis_data.clear()
             vectors.scaled = True
@@ -1160,6 +1165,9 @@ class MVTools:
         If :py:attr:`super` wasn't previously called,
         it will do so here with default values or kwargs specified in the constructor.
 
+        The extracted super clip is memoized per input clip, so that :py:attr:`analyze`,
+        :py:attr:`recalculate` and the client functions all share the same node.
+
         :param clip:    The clip to get the super clip from.
 
         :return:        VideoNode containing the super clip.
@@ -1167,11 +1175,16 @@ class MVTools:
 
         clip = fallback(clip, self.clip)
 
+        for inc, super_clip in self._super_clips:
+            if inc == clip:
+                return super_clip
+
         try:
             super_clip = clip.std.PropToClip(prop='MSuper')
         except vs.Error:
-            clip = self.super(clip)
-            super_clip = clip.std.PropToClip(prop='MSuper')
+            super_clip = self.super(clip).std.PropToClip(prop='MSuper')
+
+        self._super_clips.append((clip, super_clip))
 
         return super_clip
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Literal, overload
 
 from vsexprtools import ExprOp, ExprToken, norm_expr
@@ -175,12 +176,12 @@ class PostProcessConfig:
 
         return tr
 
-    @property
+    @cached_property
     def block_size(self) -> int:
         if self.mode is PostProcess.DFTTEST:
             from .fft import BackendInfo
 
-            backend_info = BackendInfo.from_param(self.kwargs.pop('plugin', DFTTest.Backend.AUTO))
+            backend_info = BackendInfo.from_param(self.kwargs.get('plugin', DFTTest.Backend.AUTO))
 
             if backend_info.resolved_backend.is_dfttest2:
                 return 16
@@ -197,9 +198,12 @@ class PostProcessConfig:
             return fft3d(clip, func, bw=self.block_size, bh=self.block_size, bt=self.tr * 2 + 1, **self.kwargs)
 
         if self.mode is PostProcess.DFTTEST:
-            return DFTTest.denoise(
+            kwargs = self.kwargs.copy()
+            plugin = kwargs.pop('plugin', DFTTest.Backend.AUTO)
+
+            return DFTTest(plugin=plugin).denoise(
                 clip, self.sigma, tr=self.tr, block_size=self.block_size,
-                planes=planes, **(KwargsT(overlap=int(self.block_size * 9 / 12)) | self.kwargs)  # type: ignore
+                planes=planes, **(KwargsT(overlap=int(self.block_size * 9 / 12)) | kwargs)  # type: ignore
             )
 
         if self.mode is PostProcess.NL_MEANS:
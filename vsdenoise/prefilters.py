@@ -7,6 +7,7 @@ from __future__ import annotations
 import warnings
 
 from enum import EnumMeta
+from functools import lru_cache
 from math import sin
 from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
@@ -16,8 +17,8 @@ from vsmasktools import retinex
 from vsrgtools import bilateral, box_blur, flux_smooth, gauss_blur, min_blur
 from vstools import (
     MISSING, ColorRange, ConvMode, CustomIntEnum, MissingT, PlanesT, SingleOrArr,
-    check_variable, clamp, core, depth, get_neutral_value, get_peak_value, get_y,
-    join, normalize_planes, normalize_seq, scale_delta, scale_value, split, vs
+    check_variable, clamp, complex_hash, core, depth, get_neutral_value, get_peak_value, get_video_format, get_y,
+    join, normalize_planes, normalize_seq, scale_delta, scale_value, split, vs, vs_object
 )
 
 from .bm3d import BM3D as BM3DM
@@ -35,6 +36,28 @@ __abstract__ = [
 ]
 
 
+class _CachedPrefilters(vs_object, dict[int, list[tuple[vs.VideoNode, tuple[Any, ...], vs.VideoNode]]]):
+    def __vs_del__(self, core_id: int) -> None:
+        self.clear()
+
+
+def _has_clip(value: Any) -> bool:
+    if isinstance(value, vs.VideoNode):
+        return True
+
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple, set)):
+        return False
+
+    return any(_has_clip(v) for v in value)
+
+
+# Prefiltering the same clip with the same arguments returns the same node,
+# so VapourSynth only renders it once, e.g. when it's the search clip of multiple MVTools instances.
+_cached_prefilters = _CachedPrefilters()
+
+
 class PrefilterMeta(EnumMeta):
     def __instancecheck__(cls: EnumMeta, instance: Any) -> bool:
         if isinstance(instance, PrefilterPartial):
@@ -243,12 +266,14 @@ class PrefilterBase(CustomIntEnum, metaclass=PrefilterMeta):
 
                 gaussblur = gauss_blur(boxblur, **(kwargs | dict[str, Any](planes=planes)))
 
-                if pref_type == Prefilter.GAUSSBLUR2:
-                    i2, i7 = (scale_value(x, 8, clip) for x in (2, 7))
+                if pref_type == Prefilter.GAUSSBLUR1:
+                    weights = [(100 - strg) / 100 if i in planes else 0 for i in range(clip.format.num_planes)]
 
-                    merge_expr = f'x {i7} + y < x {i2} + x {i7} - y > x {i2} - x {strg} * y {100 - strg} * + 100 / ? ?'
-                else:
-                    merge_expr = f'x {strg / 100} * y {(100 - strg) / 100} * +'
+                    return core.std.Merge(gaussblur, clip, weights)
+
+                i2, i7 = (scale_value(x, 8, clip) for x in (2, 7))
+
+                merge_expr = f'x {i7} + y < x {i2} + x {i7} - y > x {i2} - x {strg} * y {100 - strg} * + 100 / ? ?'
 
                 return norm_expr([gaussblur, clip], merge_expr, planes)
 
@@ -301,13 +326,27 @@ class PrefilterBase(CustomIntEnum, metaclass=PrefilterMeta):
         if clip is MISSING:
             return PrefilterPartial(self, planes, **kwargs)
 
+        # Clips passed as arguments can't be told apart by hash, don't cache those calls
+        cacheable = not _has_clip(kwargs)
+
+        if cacheable:
+            args = (planes, full_range, kwargs)
+            key = complex_hash.hash(self, planes, full_range, *sorted(kwargs.items()))
+
+            for inc, inargs, outc in _cached_prefilters.get(key, []):
+                if inc == clip and inargs == args:
+                    return outc
+
         out = _run(clip, planes, **kwargs)
 
         if full_range is not False:
             if full_range is True:
                 full_range = 5.0
 
-            return prefilter_to_full_range(out, full_range)
+            out = prefilter_to_full_range(out, full_range)
+
+        if cacheable:
+            _cached_prefilters.setdefault(key, []).append((clip, args, out))
 
         return out
 
@@ -770,6 +809,52 @@ class MultiPrefilter(PrefBase):  # type: ignore
         return clip
 
 
+@lru_cache
+def _range_expansion_expr(format_id: int, range_conversion: float) -> tuple[str, str]:
+    neutral = get_neutral_value(format_id)
+
+    c = sin(0.0625)
+    k = (range_conversion - 1) * c
+
+    t = ExprOp.clamp(0, 1, 'x').to_str()
+
+    head = f'{k} {1 + c} {(1 + c) * c}'
+
+    if complexpr_available:
+        head = f'{t} T! {head}'
+        t = 'T@'
+
+    return f'{head} {t} {c} + / - * {t} 1 {k} - * +', f'x {neutral} - 128 * 112 / {neutral} +'
+
+
+@lru_cache
+def _range_expansion_lut(
+    format_id: int, color_range: ColorRange, range_conversion: float
+) -> tuple[list[int], list[int]]:
+    fmt = get_video_format(format_id)
+
+    neutral = get_neutral_value(fmt)
+    max_val = get_peak_value(fmt, range_in=color_range)
+
+    c = sin(0.0625)
+    k = (range_conversion - 1) * c
+
+    low, scale = (scale_value(x, 8, fmt, ColorRange.LIMITED, color_range) for x in (16, 219))
+
+    def _to_int(v: float) -> int:
+        return int(clamp(v, 0, (1 << fmt.bits_per_sample) - 1) + 0.5)
+
+    luma_lut, chroma_lut = list[int](), list[int]()
+
+    for x in range(1 << fmt.bits_per_sample):
+        t = clamp((x - low) / scale, 0, 1)
+
+        luma_lut.append(_to_int((k * ((1 + c) - (1 + c) * c / (t + c)) + t * (1 - k)) * max_val))
+        chroma_lut.append(_to_int((x - neutral) * 128 / 112 + neutral))
+
+    return luma_lut, chroma_lut
+
+
 def prefilter_to_full_range(clip: vs.VideoNode, range_conversion: float = 5.0, planes: PlanesT = None) -> vs.VideoNode:
     """
     Convert a limited range clip to full range.\n
@@ -778,6 +863,7 @@ def prefilter_to_full_range(clip: vs.VideoNode, range_conversion: float = 5.0, p
     :param clip:                Clip to be preprocessed.
     :param range_conversion:    Value which determines what range conversion method gets used.\n
                                  * >= 1.0 - Expansion with expr based on this coefficient.
+                                            Integer clips use an equivalent precomputed lut.
                                  * >  0.0 - Expansion with retinex.
                                  * <= 0.0 - Simple conversion with resize plugin.
     :param planes:              Planes to be processed.
@@ -790,35 +876,20 @@ def prefilter_to_full_range(clip: vs.VideoNode, range_conversion: float = 5.0, p
 
     assert (fmt := work_clip.format) and clip.format
 
-    is_integer = fmt.sample_type == vs.INTEGER
-
     # Luma expansion TV->PC (up to 16% more values for motion estimation)
     if range_conversion >= 1.0:
-        neutral = get_neutral_value(work_clip)
-        max_val = get_peak_value(work_clip)
+        if fmt.sample_type == vs.INTEGER:
+            luma_lut, chroma_lut = _range_expansion_lut(fmt.id, ColorRange.from_video(work_clip), range_conversion)
 
-        c = sin(0.0625)
-        k = (range_conversion - 1) * c
-
-        if is_integer:
-            t = f'x {scale_value(16, 8, clip)} '
-            t += f'- {scale_value(219, 8, clip)} '
-            t += f'/ {ExprOp.clamp(0, 1)}'
-        else:
-            t = ExprOp.clamp(0, 1, 'x').to_str()
+            pref_full = work_clip
 
-        head = f'{k} {1 + c} {(1 + c) * c}'
+            if 0 in planes:
+                pref_full = pref_full.std.Lut(planes=0, lut=luma_lut)
 
-        if complexpr_available:
-            head = f'{t} T! {head}'
-            t = 'T@'
-
-        luma_expr = f'{head} {t} {c} + / - * {t} 1 {k} - * +'
-
-        if is_integer:
-            luma_expr += f' {max_val} *'
-
-        pref_full = norm_expr(work_clip, (luma_expr, f'x {neutral} - 128 * 112 / {neutral} +'), planes)
+            if chroma_planes := [p for p in planes if p != 0]:
+                pref_full = pref_full.std.Lut(planes=chroma_planes, lut=chroma_lut)
+        else:
+            pref_full = norm_expr(work_clip, _range_expansion_expr(fmt.id, range_conversion), planes)
     elif range_conversion > 0.0:
         pref_full = retinex(work_clip, upper_thr=range_conversion, fast=False)
     else: